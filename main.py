@@ -1,6 +1,16 @@
-import uuid
+import asyncio
+import os
+import secrets
+from types import MappingProxyType
+from bisect import bisect_left
+from operator import mul
 from datetime import timedelta, datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+
+
+# Денежные суммы внутри считаются в целых копейках, во float переводятся только для вывода.
+def _to_cents(amount: float) -> int:
+    return round(amount * 100)
 
 
 class OrderStatus:
@@ -10,6 +20,8 @@ class OrderStatus:
     DELIVERED = "Delivered"
 
 class DeliveryInfo:
+    __slots__ = ('cost', 'delivery_time', 'estimated_delivery_time')
+
     def __init__(self, cost: float, delivery_time: timedelta, estimated_delivery_time: datetime):
         self.cost = cost
         self.delivery_time = delivery_time
@@ -19,17 +31,29 @@ class DeliveryInfo:
         return f"Информация о доставка - стоимость: {self.cost}, дата доставки: {self.estimated_delivery_time.strftime('%Y-%m-%d')})"
 
 class Product:
+    __slots__ = ('id', 'name', 'description', 'price_cents', 'stock_quantity')
+
     def __init__(self, name: str, description: str, price: float, stock_quantity: int):
-        self.id = uuid.uuid4()
+        self.id = os.urandom(16)
         self.name = name
         self.description = description
         self.price = price
         self.stock_quantity = stock_quantity
 
+    @property
+    def price(self) -> float:
+        return self.price_cents / 100
+
+    @price.setter
+    def price(self, value: float):
+        self.price_cents = _to_cents(value)
+
     def get_info(self) -> str:
         return f"Название: {self.name}, описание: {self.description}, цена: {self.price}, количество: {self.stock_quantity}"
 
 class Customer:
+    __slots__ = ('name', 'email', 'address', 'phone_number')
+
     def __init__(self, name: str, email: str, address: str, phone_number: str):
         self.name = name
         self.email = email
@@ -43,170 +67,400 @@ class PaymentProcessor:
     def __init__(self, type: str):
         self.type = type
 
-    def process_payment(self, amount: float, details: dict) -> bool:
+    async def process_payment(self, amount: float, details: dict) -> bool:
         print('Обработка платежа')
         print(f"Платёж типа {self.type} был проведён, на сумму : {amount}.")
         print(f"Детали платежа: {details}")
         return True
 
 class OrderItem:
-    def __init__(self, product: Product, quantity: int):
+    __slots__ = ('product', 'quantity', 'final_price_cents')
+
+    def __init__(self, product: Product, quantity: int, price_cents: Optional[int] = None):
         self.product = product
         self.quantity = quantity
-        self.final_price = product.price * quantity
+        if price_cents is None:
+            price_cents = product.price_cents
+        self.final_price_cents = price_cents * quantity
+
+    @property
+    def final_price(self) -> float:
+        return self.final_price_cents / 100
 
     def get_subtotal(self) -> float:
         return self.final_price
 
 class ShoppingCart:
+    """Корзина хранит цены и количества в параллельных списках (SoA).
+
+    Цена позиции фиксируется при добавлении товара и обновляется при повторном
+    добавлении; заказ, собранный из корзины, берёт эти же цены.
+    """
+
     def __init__(self):
-        self.items: Dict[Product, int] = {}
+        self._products: List[Product] = []
+        self._prices_cents: List[int] = []
+        self._quantities: List[int] = []
+        # индекс позиции по product.id: bytes хешируются на уровне C
+        self._index: Dict[bytes, int] = {}
+        # подытог поддерживается инкрементально при изменении корзины
+        self._subtotal_cents: int = 0
+        # количества по товару обновляются вместе со списками, представление создаётся один раз
+        self._items: Dict[Product, int] = {}
+        self._items_view: Mapping[Product, int] = MappingProxyType(self._items)
+
+    @property
+    def items(self) -> Mapping[Product, int]:
+        """Живое представление корзины только для чтения; менять корзину через add_item/remove_item."""
+        return self._items_view
 
     def add_item(self, product: Product, quantity: int):
-        if product in self.items:
-            self.items[product] += quantity
+        pid = product.id
+        price_cents = product.price_cents
+        i = self._index.get(pid)
+        if i is not None:
+            old_quantity = self._quantities[i]
+            self._subtotal_cents += (price_cents - self._prices_cents[i]) * old_quantity + price_cents * quantity
+            self._prices_cents[i] = price_cents
+            self._quantities[i] = old_quantity + quantity
+            self._items[self._products[i]] = old_quantity + quantity
         else:
-            self.items[product] = quantity
+            self._index[pid] = len(self._products)
+            self._products.append(product)
+            self._prices_cents.append(price_cents)
+            self._quantities.append(quantity)
+            self._items[product] = quantity
+            self._subtotal_cents += price_cents * quantity
 
     def remove_item(self, product: Product):
-        if product in self.items:
-            del self.items[product]
-
-    def get_items(self) -> Dict[Product, int]:
+        i = self._index.pop(product.id, None)
+        if i is None:
+            return
+        # удаление перестановкой с последним элементом, чтобы не сдвигать списки
+        self._subtotal_cents -= self._prices_cents[i] * self._quantities[i]
+        del self._items[self._products[i]]
+        last = len(self._products) - 1
+        if i != last:
+            self._products[i] = self._products[last]
+            self._prices_cents[i] = self._prices_cents[last]
+            self._quantities[i] = self._quantities[last]
+            self._index[self._products[i].id] = i
+        self._products.pop()
+        self._prices_cents.pop()
+        self._quantities.pop()
+
+    def get_items(self) -> Mapping[Product, int]:
         return self.items
 
+    def get_lines(self) -> Tuple[List[Product], List[int], List[int]]:
+        """Позиции корзины параллельными списками: товары, цены в копейках, количества."""
+        return self._products, self._prices_cents, self._quantities
+
     def calculate_subtotal(self) -> float:
-        subtotal = float(0)
-        for product, quantity in self.items.items():
-            subtotal += product.price * float(quantity)
-        return subtotal
+        return self._subtotal_cents / 100
 
 # стратегии скидок
+# Встроенная стратегия кодируется числовым тегом и параметром, чтобы расчёт итоговой
+# суммы выполнялся одной функцией без вызова методов стратегий. Подклассы и прочие
+# стратегии считаются своим методом apply_discount.
+DISCOUNT_NONE = 0
+DISCOUNT_PERCENTAGE = 1
+DISCOUNT_FIXED = 2
+
+
+def _discount_cents(subtotal: int, discount_kind: int, discount_param: Union[float, int]) -> int:
+    """discount_param: доля для процентной скидки, сумма в копейках для фиксированной."""
+    if discount_kind == DISCOUNT_PERCENTAGE:
+        return round(subtotal * discount_param)
+    if discount_kind == DISCOUNT_FIXED:
+        return min(subtotal, discount_param)
+    return 0
+
+
 class DiscountStrategy:
+    KIND: Optional[int] = None
+
     def apply_discount(self, amount:float) ->float:
         raise NotImplementedError
 
 class NoDiscount(DiscountStrategy):
+    KIND = DISCOUNT_NONE
+
     def apply_discount(self, amount:float) ->float:
-        return amount
+        return 0.0
 
 class PercentageDiscountStrategy(DiscountStrategy):
+    KIND = DISCOUNT_PERCENTAGE
+
     def __init__(self, percentage:float):
-        self.percentage = percentage /float('100.0')
+        self.percentage = percentage / 100.0
 
     def apply_discount(self, amount:float) ->float:
-        return amount * self.percentage
+        return _discount_cents(_to_cents(amount), DISCOUNT_PERCENTAGE, self.percentage) / 100
 
 class FixedAmountDiscountStrategy(DiscountStrategy):
+    KIND = DISCOUNT_FIXED
+
     def __init__(self, fixed_amount:float):
-        self.fixed_amount = fixed_amount
+        self.fixed_amount_cents = _to_cents(fixed_amount)
+
+    @property
+    def fixed_amount(self) -> float:
+        return self.fixed_amount_cents / 100
+
+    @fixed_amount.setter
+    def fixed_amount(self, value: float):
+        self.fixed_amount_cents = _to_cents(value)
 
     def apply_discount(self, amount:float) ->float:
-        return min(amount, self.fixed_amount)
+        return _discount_cents(_to_cents(amount), DISCOUNT_FIXED, self.fixed_amount_cents) / 100
+
+
+# тег по точному классу: подкласс может переопределить расчёт, поэтому тег не наследуется
+_DISCOUNT_KINDS = {cls: cls.KIND for cls in (NoDiscount, PercentageDiscountStrategy, FixedAmountDiscountStrategy)}
+
+
+def _compute_total(subtotal: int, discount_kind: int, discount_param: Union[float, int],
+                   delivery_cost: int) -> Tuple[int, int, int]:
+    """Числовое ядро расчёта заказа в копейках: возвращает (подытог, скидка, итог)."""
+    discount = _discount_cents(subtotal, discount_kind, discount_param)
+    return subtotal, discount, subtotal - discount + delivery_cost
+
+
+def price_orders_batch(subtotals: List[int], discount_kinds: List[int],
+                       discount_params: List[Union[float, int]],
+                       delivery_costs: List[int]) -> List[Tuple[int, int, int]]:
+    """Пакетный расчёт: _compute_total для каждого заказа пачки."""
+    return list(map(_compute_total, subtotals, discount_kinds, discount_params, delivery_costs))
+
+# --- DeliveryStrategy ---
+DELIVERY_PICKUP = 0
+DELIVERY_COURIER = 1
+DELIVERY_POST = 2
 
-# --- DeliveryStrategy (Без изменений) ---
 class DeliveryStrategy:
+    # встроенные стратегии считаются по таблице _DELIVERY_TIERS,
+    # для подклассов и прочих стратегий вызывается calculate_cost
+    KIND: Optional[int] = None
+
     def calculate_cost(self, address: str, total_weight: float) -> float:
         raise NotImplementedError
 
-    def estimate_delivery_time(self, address: str) -> DeliveryInfo:
+    def estimate_delivery_time(self, address: str, now: Optional[datetime] = None) -> DeliveryInfo:
         raise NotImplementedError
 
+    async def estimate_delivery_time_async(self, address: str, now: Optional[datetime] = None) -> DeliveryInfo:
+        # стратегии с запросом к службе доставки переопределяют асинхронный вариант;
+        # now передаётся только явно заданным, чтобы работали стратегии с сигнатурой (address)
+        if now is None:
+            return self.estimate_delivery_time(address)
+        return self.estimate_delivery_time(address, now)
+
 class PickupDeliveryStrategy(DeliveryStrategy):
-    COST = float('0.00')
+    KIND = DELIVERY_PICKUP
+    COST = 0.0
     TIME_DELTA = timedelta(hours=4)
 
     def calculate_cost(self, address: str, total_weight: float) -> float:
         return self.COST
 
-    def estimate_delivery_time(self, address: str) -> DeliveryInfo:
-        estimated = datetime.now() + self.TIME_DELTA
-        return DeliveryInfo(self.COST, self.TIME_DELTA, estimated)
+    def estimate_delivery_time(self, address: str, now: Optional[datetime] = None) -> DeliveryInfo:
+        now = now or datetime.now()
+        return DeliveryInfo(self.COST, self.TIME_DELTA, now + self.TIME_DELTA)
 
 
 class CourierDeliveryStrategy(DeliveryStrategy):
-    COST = float('400.00')
+    KIND = DELIVERY_COURIER
+    # тарифная сетка по весу (границы включительно): до 5кг, до 10кг, до 20кг, до 50кг, свыше 50кг
+    WEIGHT_THRESHOLDS = (5.0, 10.0, 20.0, 50.0)
+    TIER_COSTS = (150.0, 250.0, 350.0, 500.0, 800.0)
     TIME_DELTA = timedelta(days=2)
 
     def calculate_cost(self, address: str, total_weight: float) -> float:
-        return self.COST
+        return self.TIER_COSTS[bisect_left(self.WEIGHT_THRESHOLDS, total_weight)]
 
-    def estimate_delivery_time(self, address: str) -> DeliveryInfo:
-        estimated = datetime.now() + self.TIME_DELTA
-        return DeliveryInfo(float(0), self.TIME_DELTA, estimated)
+    def estimate_delivery_time(self, address: str, now: Optional[datetime] = None) -> DeliveryInfo:
+        now = now or datetime.now()
+        # у курьера нет единого тарифа: стоимость зависит от веса и проставляется заказом
+        return DeliveryInfo(0.0, self.TIME_DELTA, now + self.TIME_DELTA)
 
 
 class PostDeliveryStrategy(DeliveryStrategy):
-    COST = float('150.00')
+    KIND = DELIVERY_POST
+    COST = 150.0
     TIME_DELTA = timedelta(days=7)
 
     def calculate_cost(self, address: str, total_weight: float) -> float:
         return self.COST
 
-    def estimate_delivery_time(self, address: str) -> DeliveryInfo:
-        estimated = datetime.now() + self.TIME_DELTA
-        return DeliveryInfo(float(0), self.TIME_DELTA, estimated)
+    def estimate_delivery_time(self, address: str, now: Optional[datetime] = None) -> DeliveryInfo:
+        now = now or datetime.now()
+        return DeliveryInfo(self.COST, self.TIME_DELTA, now + self.TIME_DELTA)
+
+
+# тег по точному классу, как и для скидок
+_DELIVERY_KINDS = {cls: cls.KIND for cls in (PickupDeliveryStrategy, CourierDeliveryStrategy, PostDeliveryStrategy)}
+
+# тарифы доставки в копейках по тегу стратегии: пороги веса и цена каждого диапазона
+_DELIVERY_TIERS = {
+    DELIVERY_PICKUP: ((), (_to_cents(PickupDeliveryStrategy.COST),)),
+    DELIVERY_COURIER: (CourierDeliveryStrategy.WEIGHT_THRESHOLDS,
+                       tuple(map(_to_cents, CourierDeliveryStrategy.TIER_COSTS))),
+    DELIVERY_POST: ((), (_to_cents(PostDeliveryStrategy.COST),)),
+}
+
+
+def _delivery_cost_cents(delivery_kind: int, total_weight: float) -> int:
+    thresholds, costs = _DELIVERY_TIERS[delivery_kind]
+    return costs[bisect_left(thresholds, total_weight)]
+
+
+# шаблон сводки заказа разбирается один раз при импорте
+_SUMMARY_TMPL = ("ID заказа: {}\n"
+                 "  покупатель: {}\n"
+                 "  Статус: {}\n"
+                 "  Цена товара: {:.2f}\n"
+                 "  Скидка на товар: {:.2f}\n"
+                 "  Цена доставки: {:.2f}\n"
+                 "  Итоговая цена: {:.2f}").format
 
 
 class Order:
-    """Контекст: Фиксация транзакции. Делегирование расчета скидки и доставки стратегиям."""
+    """Контекст: Фиксация транзакции.
+
+    Стратегии встроенных классов при установке разворачиваются в теги и считаются
+    через _compute_total и _DELIVERY_TIERS; параметры скидки читаются в момент
+    расчёта. Для подклассов и прочих стратегий вызываются их методы
+    apply_discount и calculate_cost.
+    """
+
+    __slots__ = ('display_id', 'customer', '_item_products', '_item_prices_cents', '_item_quantities', '_subtotal_cents',
+                 'total_amount', 'status', 'discount_strategy', 'delivery_strategy',
+                 'applied_discount', 'delivery_info', 'subtotal_calculated', 'delivery_cost',
+                 '_discount_kind', '_delivery_kind')
 
     def __init__(self, customer: Customer):
-        self.id = uuid.uuid4()
+        # короткий идентификатор для отображения, полный id заказу не нужен
+        self.display_id = secrets.token_hex(4)
         self.customer = customer
-        self.items: List[OrderItem] = []
-        self.total_amount: float = float('0.00')
+        # позиции заказа хранятся параллельными списками, OrderItem собирается по запросу
+        self._item_products: List[Product] = []
+        self._item_prices_cents: List[int] = []
+        self._item_quantities: List[int] = []
+        self._subtotal_cents: int = 0
+        self.total_amount: float = 0.0
         self.status: str = OrderStatus.PENDING
 
         self.discount_strategy: DiscountStrategy = NoDiscount()
         self.delivery_strategy: Optional[DeliveryStrategy] = None
 
-        self.applied_discount: float = float('0.00')
+        # теги встроенных стратегий; None означает стратегию, которая считается своими методами
+        self._discount_kind: Optional[int] = DISCOUNT_NONE
+        self._delivery_kind: Optional[int] = None
+
+        self.applied_discount: float = 0.0
         self.delivery_info: Optional[DeliveryInfo] = None
 
-        self.subtotal_calculated: float = float('0.00')
-        self.delivery_cost: float = float('0.00')
+        self.subtotal_calculated: float = 0.0
+        self.delivery_cost: float = 0.0
 
     def set_discount_strategy(self, strategy: DiscountStrategy):
         self.discount_strategy = strategy
+        self._discount_kind = _DISCOUNT_KINDS.get(type(strategy))
 
     def set_delivery_strategy(self, strategy: DeliveryStrategy):
         self.delivery_strategy = strategy
-
-    def add_item_from_cart(self, product: Product, quantity: int):
-        self.items.append(OrderItem(product, quantity))
+        # поля экземпляра означают переопределённые тарифы, таблица их не учитывает
+        self._delivery_kind = None if vars(strategy) else _DELIVERY_KINDS.get(type(strategy))
+
+    def add_item_from_cart(self, product: Product, quantity: int, price_cents: Optional[int] = None):
+        # цена строки берётся из корзины, как в add_items_bulk; без неё — текущая цена товара
+        if price_cents is None:
+            price_cents = product.price_cents
+        self._item_products.append(product)
+        self._item_prices_cents.append(price_cents)
+        self._item_quantities.append(quantity)
+        self._subtotal_cents += price_cents * quantity
+
+    def add_items_bulk(self, products: List[Product], prices_cents: List[int], quantities: List[int]):
+        if not len(products) == len(prices_cents) == len(quantities):
+            raise ValueError("Списки товаров, цен и количеств должны быть одной длины.")
+        self._item_products.extend(products)
+        self._item_prices_cents.extend(prices_cents)
+        self._item_quantities.extend(quantities)
+        self._subtotal_cents += sum(map(mul, prices_cents, quantities))
+
+    def get_items(self) -> List[OrderItem]:
+        return [OrderItem(product, quantity, price_cents) for product, price_cents, quantity in
+                zip(self._item_products, self._item_prices_cents, self._item_quantities)]
 
     def calculate_subtotal(self) -> float:
-        self.subtotal_calculated = sum(item.get_subtotal() for item in self.items)
+        self.subtotal_calculated = self._subtotal_cents / 100
         return self.subtotal_calculated
 
     def calculate_total(self, total_weight: float) -> float:
+        self.price(total_weight)
+        self._set_delivery_info(self.delivery_strategy.estimate_delivery_time(self.customer.address))
+        return self.total_amount
 
-        subtotal = self.calculate_subtotal()
-
-        self.applied_discount = self.discount_strategy.apply_discount(subtotal)
-        amount_after_discount = subtotal - self.applied_discount
+    def price(self, total_weight: float) -> float:
+        """Рассчитывает суммы заказа без оценки сроков доставки и возвращает итог."""
+        inputs = self.pricing_inputs(total_weight)
+        self.apply_totals(_compute_total(*inputs), inputs[3])
+        return self.total_amount
 
-        if not self.delivery_strategy:
+    def pricing_inputs(self, total_weight: float) -> Tuple[int, int, Union[float, int], int]:
+        """Аргументы _compute_total в копейках: (подытог, тег скидки, параметр скидки, доставка)."""
+        delivery_cost = self._resolve_delivery_cost(total_weight)
+        discount_kind, discount_param = self._resolve_discount()
+        return self._subtotal_cents, discount_kind, discount_param, delivery_cost
+
+    def _resolve_discount(self) -> Tuple[int, Union[float, int]]:
+        kind = self._discount_kind
+        # параметр ядра в единицах своего тега: доля или копейки
+        if kind == DISCOUNT_PERCENTAGE:
+            return kind, self.discount_strategy.percentage
+        if kind == DISCOUNT_FIXED:
+            return kind, self.discount_strategy.fixed_amount_cents
+        if kind == DISCOUNT_NONE:
+            return kind, 0
+        # скидку пользовательской стратегии передаём ядру как фиксированную сумму
+        discount = self.discount_strategy.apply_discount(self._subtotal_cents / 100)
+        return DISCOUNT_FIXED, _to_cents(discount)
+
+    def _resolve_delivery_cost(self, total_weight: float) -> int:
+        if self.delivery_strategy is None:
             raise ValueError("Необходимо выбрать стратегию доставки.")
+        if self._delivery_kind is None:
+            return _to_cents(self.delivery_strategy.calculate_cost(self.customer.address, total_weight))
+        return _delivery_cost_cents(self._delivery_kind, total_weight)
+
+    def apply_totals(self, totals: Tuple[int, int, int], delivery_cost: int):
+        """Записывает результат _compute_total и стоимость доставки (в копейках) в поля заказа."""
+        subtotal, discount, total = totals
+        self.subtotal_calculated = subtotal / 100
+        self.applied_discount = discount / 100
+        self.delivery_cost = delivery_cost / 100
+        self.total_amount = total / 100
+
+    async def estimate_delivery(self, now: Optional[datetime] = None) -> DeliveryInfo:
+        if self.delivery_strategy is None:
+            raise ValueError("Необходимо выбрать стратегию доставки.")
+        if now is None:
+            estimate = self.delivery_strategy.estimate_delivery_time_async(self.customer.address)
+        else:
+            estimate = self.delivery_strategy.estimate_delivery_time_async(self.customer.address, now)
+        return self._set_delivery_info(await estimate)
 
-        self.delivery_cost = self.delivery_strategy.calculate_cost(self.customer.address, total_weight)
-
-        self.delivery_info = self.delivery_strategy.estimate_delivery_time(self.customer.address)
-        self.delivery_info.cost = self.delivery_cost
-
-        self.total_amount = amount_after_discount + self.delivery_cost
-        return self.total_amount
+    def _set_delivery_info(self, delivery_info: DeliveryInfo) -> DeliveryInfo:
+        delivery_info.cost = self.delivery_cost
+        self.delivery_info = delivery_info
+        return delivery_info
 
     def get_order_summary(self) -> str:
-        summary = (f"ID заказа: {self.id.hex[:8]}\n"
-                   f"  покупатель: {self.customer.name}\n"
-                   f"  Статус: {self.status}\n"
-                   f"  Цена товара: {self.subtotal_calculated:.2f}\n"
-                   f"  Скидка на товар: {self.applied_discount:.2f}\n"
-                   f"  Цена доставки: {self.delivery_cost:.2f}\n"
-                   f"  Итоговая цена: {self.total_amount:.2f}")
-        return summary
+        return _SUMMARY_TMPL(self.display_id, self.customer.name, self.status,
+                             self.subtotal_calculated, self.applied_discount,
+                             self.delivery_cost, self.total_amount)
 
 # фасад
 
@@ -214,7 +468,7 @@ class OrderPlacementFacade:
     def __init__(self, payment_processor: PaymentProcessor):
         self.payment_processor = payment_processor
 
-    def place_order(self,
+    async def place_order(self,
                     cart: ShoppingCart,
                     customer: Customer,
                     discount_strategy: DiscountStrategy,
@@ -225,30 +479,79 @@ class OrderPlacementFacade:
         order = Order(customer)
         total_weight = float(delivery_details.get('weight', 0))
 
-        for product, quantity in cart.get_items().items():
-            order.add_item_from_cart(product, quantity)
+        order.add_items_bulk(*cart.get_lines())
 
         order.set_discount_strategy(discount_strategy)
         order.set_delivery_strategy(delivery_strategy)
 
-        final_amount = order.calculate_total(total_weight)
+        # оценка доставки выполняется ниже параллельно с оплатой
+        final_amount = order.price(total_weight)
         print(f"Расчет завершен. Сумма к оплате: {final_amount:.2f}")
 
-        if self.payment_processor.process_payment(final_amount, payment_details):
-            order.status = OrderStatus.PAID
-            print(f"Заказ успешно оплачен. Статус: {order.status}")
-        else:
-            order.status = OrderStatus.PENDING
-            print("Ошибка оплаты.")
+        # оплата и оценка срока доставки независимы: оценка не проверяет
+        # выполнимость доставки, поэтому запросы выполняются параллельно
+        paid, _ = await asyncio.gather(self._pay(order, payment_details), order.estimate_delivery())
+        if not paid:
             return order
 
         print("Заказ успешно оформлен")
         return order
 
+    async def place_orders_bulk(self,
+                          carts: List[ShoppingCart],
+                          customers: List[Customer],
+                          discount_strategy: DiscountStrategy,
+                          delivery_strategy: DeliveryStrategy,
+                          delivery_details: List[dict],
+                          payment_details: dict) -> List[Order]:
+        """Оформление пачки заказов: все суммы считаются одним вызовом price_orders_batch.
+
+        carts, customers и delivery_details задаются по одному элементу на заказ.
+        """
+
+        orders: List[Order] = []
+        inputs = []
+        for cart, customer, details in zip(carts, customers, delivery_details, strict=True):
+            order = Order(customer)
+            order.add_items_bulk(*cart.get_lines())
+            order.set_discount_strategy(discount_strategy)
+            order.set_delivery_strategy(delivery_strategy)
+            inputs.append(order.pricing_inputs(float(details.get('weight', 0))))
+            orders.append(order)
+        if not orders:
+            return orders
+
+        subtotals, discount_kinds, discount_params, delivery_costs = map(list, zip(*inputs))
+        results = price_orders_batch(subtotals, discount_kinds, discount_params, delivery_costs)
+
+        for order, totals, delivery_cost in zip(orders, results, delivery_costs):
+            order.apply_totals(totals, delivery_cost)
+            print(f"Расчет завершен. Сумма к оплате: {order.total_amount:.2f}")
+
+        # одна метка времени на всю пачку вместо datetime.now() на каждый заказ;
+        # пользовательские стратегии могут не принимать now, им он не передаётся
+        now = datetime.now() if type(delivery_strategy) in _DELIVERY_KINDS else None
+        paid = await asyncio.gather(*(self._pay(order, payment_details) for order in orders),
+                                    *(order.estimate_delivery(now) for order in orders))
+        for is_paid in paid[:len(orders)]:
+            if is_paid:
+                print("Заказ успешно оформлен")
+
+        return orders
+
+    async def _pay(self, order: Order, payment_details: dict) -> bool:
+        if await self.payment_processor.process_payment(order.total_amount, payment_details):
+            order.status = OrderStatus.PAID
+            print(f"Заказ успешно оплачен. Статус: {order.status}")
+            return True
+
+        order.status = OrderStatus.PENDING
+        print("Ошибка оплаты.")
+        return False
 
-milk = Product("Молоко", "2.5% жирности", float('85.00'), 100)
-bread = Product("Хлеб", "Белый нарезной", float('40.00'), 50)
-heavy_item = Product("Гантель 15кг", "Для спорта", float('1200.00'), 10)
+milk = Product("Молоко", "2.5% жирности", 85.0, 100)
+bread = Product("Хлеб", "Белый нарезной", 40.0, 50)
+heavy_item = Product("Гантель 15кг", "Для спорта", 1200.0, 10)
 
 client = Customer("Иван Петров", "ma@gmail.com", "ул. Ленина, 10, Москва", "+7-999-111-22-33")
 processor = PaymentProcessor('Наличкой')
@@ -259,7 +562,7 @@ cart.add_item(bread, 1) # 40
 cart.add_item(heavy_item, 1) # 1200
 print(f"Сумма корзины до скидок: {cart.calculate_subtotal():.2f}")
 
-discount_strategy = FixedAmountDiscountStrategy(fixed_amount=float('100.0'))
+discount_strategy = FixedAmountDiscountStrategy(fixed_amount=100.0)
 delivery_strategy = CourierDeliveryStrategy()
 
 delivery_details = {'address': client.address, 'weight': 16.0}
@@ -267,14 +570,14 @@ payment_details = {'card_number': '1234...'}
 
 facade = OrderPlacementFacade(processor)
 
-final_order = facade.place_order(
+final_order = asyncio.run(facade.place_order(
     cart=cart,
     customer=client,
     discount_strategy=discount_strategy,
     delivery_strategy=delivery_strategy,
     delivery_details=delivery_details,
     payment_details=payment_details
-)
+))
 
 print("\n--- Финальный Заказ ---")
 print(final_order.get_order_summary())